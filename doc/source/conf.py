@@ -6,9 +6,30 @@
 # serve to show the default.
 from __future__ import print_function
 
-import BioSimSpace
-print("Generating doc for BioSimSpace version {version} installed in {path}"
-      .format(version=BioSimSpace.__version__, path=BioSimSpace.__path__))
+from docutils.parsers.rst import directives
+from functools import lru_cache as _lru_cache
+from importlib import import_module as _import_module
+from sphinx.ext.autosummary import Autosummary
+from sphinx.ext.autosummary import get_documenter
+
+import importlib.util as _importlib_util
+import inspect as _inspect
+import os as _os
+
+# Load the version information directly from the source tree so that we
+# don't need to import the entire BioSimSpace package when the configuration
+# is parsed. The package itself is only imported once the builder starts.
+_version_file = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)),
+                              _os.pardir, _os.pardir, "python",
+                              "BioSimSpace", "_version.py")
+if _os.path.isfile(_version_file):
+    _spec = _importlib_util.spec_from_file_location("_bss_version", _version_file)
+    _bss_version = _importlib_util.module_from_spec(_spec)
+    _spec.loader.exec_module(_bss_version)
+    __version__ = _bss_version.get_versions()["version"]
+    del _spec, _bss_version
+else:
+    from BioSimSpace import __version__
 
 # -- General configuration -----------------------------------------------
 # Add any Sphinx extension module names here, as strings. They can be extensions
@@ -47,7 +68,6 @@ copyright = u'2017-2021 Michel Lab'
 # built documents.
 #
 # The short X.Y version.
-from BioSimSpace import __version__
 version = __version__.split("+")[0]
 # The full version. Tag, plus commits ahead.
 release = __version__.split("g")[0][:-1]
@@ -257,6 +277,11 @@ texinfo_documents = [
 # Autosummary
 # -----------------------------------------------------------------------------
 
+# Note that autosummary never touches a stub whose content is unchanged
+# (Sphinx < 3 skips existing stubs entirely, later versions compare the
+# rendered content before writing), so stub generation doesn't bump file
+# modification times and invalidate the doctree cache on incremental builds.
+# Run 'make clean' to force the stubs to be regenerated.
 autosummary_generate = True
 autodoc_default_flags = ['members', 'inherited-members']
 
@@ -273,58 +298,70 @@ def skip_deprecated(app, what, name, obj, skip, options):
         return True
     return skip or False
 
+def print_banner(app):
+    import BioSimSpace
+    print("Generating doc for BioSimSpace version {version} installed in {path}"
+          .format(version=BioSimSpace.__version__, path=BioSimSpace.__path__))
+
+# Avoid evaluating descriptors when scanning members, where possible.
+# (inspect.getmembers_static is only available for Python >= 3.11.)
+_getmembers = getattr(_inspect, "getmembers_static", _inspect.getmembers)
+
+# Note that the caches below are local to each process used for a parallel
+# build, and the Sphinx application is only ever read, so the directive
+# shares no mutable state between concurrent readers.
+@_lru_cache(maxsize=None)
+def _members_for(app, obj, typ):
+    """Return the names of all members of obj with documenter type typ."""
+    items = []
+    for name, member in _getmembers(obj):
+        try:
+            documenter = get_documenter(app, member, obj)
+        except AttributeError:
+            continue
+        if documenter.objtype == typ:
+            items.append(name)
+    return tuple(items)
+
+@_lru_cache(maxsize=None)
+def _resolve_class(clazz):
+    """Return the class object from its fully qualified name."""
+    (module_name, class_name) = clazz.rsplit('.', 1)
+    return getattr(_import_module(module_name), class_name)
+
+class AutoAutoSummary(Autosummary):
+
+    option_spec = {
+        'methods': directives.unchanged,
+        'attributes': directives.unchanged
+    }
+
+    required_arguments = 1
+
+    def get_members(self, obj, typ, include_public=None):
+        include_public = frozenset(include_public or ())
+        items = list(_members_for(self.env.app, obj, typ))
+        public = [x for x in items if x in include_public or not x.startswith('_')]
+        return public, items
+
+    def run(self):
+        clazz = self.arguments[0]
+        c = _resolve_class(clazz)
+        if 'methods' in self.options:
+            _, methods = self.get_members(c, 'method', ['__init__'])
+
+            self.content = ["~%s.%s" % (clazz, method) for method in methods if not method.startswith('_')]
+        if 'attributes' in self.options:
+            _, attribs = self.get_members(c, 'attribute')
+            self.content = ["~%s.%s" % (clazz, attrib) for attrib in attribs if not attrib.startswith('_')]
+        return super(AutoAutoSummary, self).run()
+
 def setup(app):
+    app.connect('builder-inited', print_banner)
     app.connect('autodoc-skip-member', skip_deprecated)
-    try:
-        from sphinx.ext.autosummary import Autosummary
-        from sphinx.ext.autosummary import get_documenter
-        from docutils.parsers.rst import directives
-        from sphinx.util.inspect import safe_getattr
-        import re
-
-        class AutoAutoSummary(Autosummary):
-
-            option_spec = {
-                'methods': directives.unchanged,
-                'attributes': directives.unchanged
-            }
-
-            required_arguments = 1
-
-            @staticmethod
-            def get_members(obj, typ, include_public=None):
-                if not include_public:
-                    include_public = []
-                items = []
-                for name in dir(obj):
-                    try:
-                        documenter = get_documenter(app, safe_getattr(obj, name), obj)
-                    except AttributeError:
-                        continue
-                    if documenter.objtype == typ:
-                        items.append(name)
-                public = [x for x in items if x in include_public or not x.startswith('_')]
-                return public, items
-
-            def run(self):
-                clazz = self.arguments[0]
-                try:
-                    (module_name, class_name) = clazz.rsplit('.', 1)
-                    m = __import__(module_name, globals(), locals(), [class_name])
-                    c = getattr(m, class_name)
-                    if 'methods' in self.options:
-                        _, methods = self.get_members(c, 'method', ['__init__'])
-
-                        self.content = ["~%s.%s" % (clazz, method) for method in methods if not method.startswith('_')]
-                    if 'attributes' in self.options:
-                        _, attribs = self.get_members(c, 'attribute')
-                        self.content = ["~%s.%s" % (clazz, attrib) for attrib in attribs if not attrib.startswith('_')]
-                finally:
-                    return super(AutoAutoSummary, self).run()
-
-        app.add_directive('autoautosummary', AutoAutoSummary)
-    except BaseException as e:
-        raise e
+
+    # Replace any previously registered directive with the same name.
+    app.add_directive('autoautosummary', AutoAutoSummary, override=True)
 
 
 # Napoleon settings
@@ -29,24 +29,46 @@ __email__ = "lester.hedges@gmail.com"
 __all__ = ["Equilibration"]
 
 import math as _math
-import pytest as _pytest
+import sys as _sys
 import warnings as _warnings
 
 from BioSimSpace import Types as _Types
 
 from ._protocol import Protocol as _Protocol
 
+# Store the types used for validation in the setters.
+_Time = _Types.Time
+_Temperature = _Types.Temperature
+_Pressure = _Types.Pressure
+
+# Translation table used to convert keywords to lower case and strip whitespace
+# in a single pass.
+_keyword_table = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+                               "abcdefghijklmnopqrstuvwxyz",
+                               " \t\n")
+
 class Equilibration(_Protocol):
     """A class for storing equilibration protocols."""
 
-    # Supported restraint keywords.
-    _restraints = ["backbone", "heavy", "all", "none"]
+    # Store member data in slots rather than a per-instance dictionary.
+    __slots__ = ("_timestep", "_runtime", "_temperature_start",
+                 "_temperature_end", "_is_const_temp", "_pressure",
+                 "_report_interval", "_restart_interval", "_restraint")
+
+    # Supported restraint keywords. (String literals are interned, so
+    # membership tests against interned input can match by identity.)
+    _restraints = ("backbone", "heavy", "all", "none")
+
+    # Default constructor arguments, created once when the class is loaded.
+    _default_timestep = _Time(2, "femtosecond")
+    _default_runtime = _Time(0.2, "nanoseconds")
+    _default_temperature = _Temperature(300, "kelvin")
 
     def __init__(self,
-                 timestep=_Types.Time(2, "femtosecond"),
-                 runtime=_Types.Time(0.2, "nanoseconds"),
-                 temperature_start=_Types.Temperature(300, "kelvin"),
-                 temperature_end=_Types.Temperature(300, "kelvin"),
+                 timestep=_default_timestep,
+                 runtime=_default_runtime,
+                 temperature_start=_default_temperature,
+                 temperature_end=_default_temperature,
                  temperature=None,
                  pressure=None,
                  report_interval=100,
@@ -166,22 +188,22 @@ class Equilibration(_Protocol):
         if self._is_customised:
             return "<BioSimSpace.Protocol.Custom>"
         else:
-            return ("<BioSimSpace.Protocol.Equilibration: timestep=%s, runtime=%s, "
-                    "temperature_start=%s, temperature_end=%s, pressure=%s, "
-                    "report_interval=%d, restart_interval=%d,restraint=%r>"
-                   ) % (self._timestep, self._runtime, self._temperature_start, self._temperature_end,
-                           self._pressure, self._report_interval, self._restart_interval, self._restraint)
+            return (f"<BioSimSpace.Protocol.Equilibration: timestep={self._timestep}, "
+                    f"runtime={self._runtime}, temperature_start={self._temperature_start}, "
+                    f"temperature_end={self._temperature_end}, pressure={self._pressure}, "
+                    f"report_interval={self._report_interval:d}, "
+                    f"restart_interval={self._restart_interval:d},restraint={self._restraint!r}>")
 
     def __repr__(self):
         """Return a string showing how to instantiate the object."""
         if self._is_customised:
             return "<BioSimSpace.Protocol.Custom>"
         else:
-            return ("BioSimSpace.Protocol.Equilibration(timestep=%s, runtime=%s, "
-                    "temperature_start=%s, temperature_end=%s, pressure=%s, "
-                    "report_interval=%d, restart_interval=%d, restraint=%r)"
-                   ) % (self._timestep, self._runtime, self._temperature_start, self._temperature_end,
-                           self._pressure, self._report_interval, self._restart_interval, self._restraint)
+            return (f"BioSimSpace.Protocol.Equilibration(timestep={self._timestep}, "
+                    f"runtime={self._runtime}, temperature_start={self._temperature_start}, "
+                    f"temperature_end={self._temperature_end}, pressure={self._pressure}, "
+                    f"report_interval={self._report_interval:d}, "
+                    f"restart_interval={self._restart_interval:d}, restraint={self._restraint!r})")
 
     def getTimeStep(self):
         """Return the time step.
@@ -203,7 +225,7 @@ class Equilibration(_Protocol):
            time : :class:`Time <BioSimSpace.Types.Time>`
                The integration time step.
         """
-        if type(timestep) is _Types.Time:
+        if type(timestep) is _Time:
             self._timestep = timestep
         else:
             raise TypeError("'timestep' must be of type 'BioSimSpace.Types.Time'")
@@ -228,7 +250,7 @@ class Equilibration(_Protocol):
            runtime : :class:`Time <BioSimSpace.Types.Time>`
                The simulation run time.
         """
-        if type(runtime) is _Types.Time:
+        if type(runtime) is _Time:
             self._runtime = runtime
         else:
             raise TypeError("'runtime' must be of type 'BioSimSpace.Types.Time'")
@@ -253,13 +275,7 @@ class Equilibration(_Protocol):
            temperature : :class:`Temperature <BioSimSpace.Types.Temperature>`
                The starting temperature.
         """
-
-        if type(temperature) is _Types.Temperature:
-            if temperature.kelvin().magnitude() == _pytest.approx(0):
-                temperature._magnitude = 0.01
-            self._temperature_start = temperature
-        else:
-            raise TypeError("'temperature_start' must be of type 'BioSimSpace.Types.Temperature'")
+        self._temperature_start = _validate_temperature(temperature, "temperature_start")
 
     def getEndTemperature(self):
         """Return the final temperature.
@@ -281,12 +297,7 @@ class Equilibration(_Protocol):
            temperature : :class:`Temperature <BioSimSpace.Types.Temperature>`
                The final temperature.
         """
-        if type(temperature) is _Types.Temperature:
-            if temperature.kelvin().magnitude() == _pytest.approx(0):
-                temperature._magnitude = 0.01
-            self._temperature_end = temperature
-        else:
-            raise TypeError("'temperature_end' must be of type 'BioSimSpace.Types.Temperature'")
+        self._temperature_end = _validate_temperature(temperature, "temperature_end")
 
     def getPressure(self):
         """Return the pressure.
@@ -308,7 +319,7 @@ class Equilibration(_Protocol):
            pressure : :class:`Pressure <BioSimSpace.Types.Pressure>`
                The pressure.
         """
-        if type(pressure) is _Types.Pressure:
+        if type(pressure) is _Pressure:
             self._pressure = pressure
         else:
             raise TypeError("'pressure' must be of type 'BioSimSpace.Types.Pressure'")
@@ -415,20 +426,28 @@ class Equilibration(_Protocol):
 
         if type(restraint) is str:
             # Convert to lower case and strip whitespace.
-            restraint = restraint.lower().replace(" ", "")
+            restraint = _sys.intern(restraint.translate(_keyword_table))
             if restraint not in self._restraints:
-                raise ValueError(f"'restraint' must be one of: {allowed}")
+                raise ValueError(f"'restraint' must be one of: {list(self._restraints)}")
             # Set to NoneType if equal to "none", since this makes checking
             # whether a restraint is set elsewhere much easier.
             if restraint == "none":
                 restraint = None
 
         elif type(restraint) is list:
-            if not all(isinstance(x, int) for x in restraint):
+            import numpy as _np
+
+            # Convert to a NumPy array and validate the shape and element
+            # type. (An empty list is converted to a float array, so allow
+            # that.) Ragged nested lists can't be converted at all.
+            try:
+                indices = _np.asarray(restraint)
+            except (TypeError, ValueError):
+                raise ValueError("'restraint' must be a list of 'int' types!") from None
+            if indices.ndim != 1 or (len(restraint) > 0 and indices.dtype.kind not in "iu"):
                 raise ValueError("'restraint' must be a list of 'int' types!")
-            # Create a set to sort and ensure no duplicates, then convert back to a list.
-            restraint = list(set(restraint))
-            restraint.sort()
+            # Sort and remove duplicates, then convert back to a list of int.
+            restraint = _np.unique(indices).astype(int).tolist()
 
         else:
             raise TypeError("'restraint' must be of type 'str', or a list of 'int' types.")
@@ -456,4 +475,12 @@ class Equilibration(_Protocol):
            restraints : [str]
                A list of the supported restraint keywords.
         """
-        return cls._restraints.copy()
+        return list(cls._restraints)
+
+def _validate_temperature(temperature, name):
+    """Validate a temperature, replacing absolute zero with 0.01 Kelvin."""
+    if type(temperature) is not _Temperature:
+        raise TypeError(f"'{name}' must be of type 'BioSimSpace.Types.Temperature'")
+    if abs(temperature.kelvin().magnitude()) < 1e-12:
+        temperature._magnitude = 0.01
+    return temperature
@@ -28,9 +28,14 @@ __email__ = "lester.hedges@gmail.com"
 
 __all__ = ["Protocol"]
 
+from contextlib import contextmanager as _contextmanager
+
 class Protocol():
     """A base class for holding simulation protocols."""
 
+    # Declare the base class member data so that subclasses can use __slots__.
+    __slots__ = ("_is_customised", "_validation_depth")
+
     def __init__(self):
         """Constructor."""
 
@@ -41,6 +46,90 @@ class Protocol():
         # Flag that the protocol hasn't been customised.
         self._is_customised = False
 
+        # The number of open batch updates. Consistency checks between member
+        # data are deferred while this is non-zero.
+        self._validation_depth = 0
+
+    @_contextmanager
+    def batch_update(self):
+        """Update multiple protocol parameters, deferring any checks that
+           the parameters are consistent with each other until the end of
+           the context. If an exception is raised within the context, or
+           the parameters are inconsistent at the end of it, then the
+           protocol is restored to its original state.
+
+           Yields
+           ------
+
+           protocol : :class:`Protocol <BioSimSpace.Protocol>`
+               This protocol.
+        """
+
+        # Nested batch updates are handled by the outermost one.
+        if self._validation_depth > 0:
+            self._validation_depth += 1
+            try:
+                yield self
+            finally:
+                self._validation_depth -= 1
+            return
+
+        # Store the current state so that it can be restored on failure.
+        state = self._get_state()
+
+        self._validation_depth += 1
+        try:
+            yield self
+            self._validation_depth -= 1
+
+            # Check the member data once all updates have been made.
+            self._revalidate()
+
+        except BaseException:
+            self._set_state(state)
+            raise
+
+    def _get_state(self):
+        """Internal function to return the member data of the protocol.
+
+           Returns
+           -------
+
+           state : dict
+               A dictionary mapping attribute names to values.
+        """
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def _set_state(self, state):
+        """Internal function to restore the member data of the protocol.
+
+           Parameters
+           ----------
+
+           state : dict
+               A dictionary mapping attribute names to values, as returned
+               by _get_state.
+        """
+        # Remove any attributes that weren't set when the state was stored.
+        for name in self._get_state():
+            if name not in state:
+                delattr(self, name)
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _revalidate(self):
+        """Internal function to check that member data is consistent. This
+           should be overloaded by protocols whose parameters depend on each
+           other.
+        """
+        pass
+
     def _setCustomised(self, is_customised):
         """Internal function to flag whether a protocol has been customised.
 
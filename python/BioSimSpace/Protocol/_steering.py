@@ -28,8 +28,8 @@ __email__ = "lester.hedges@gmail.com"
 
 __all__ = ["Steering"]
 
-import math as _math
 import os as _os
+import warnings as _warnings
 
 from BioSimSpace import Types as _Types
 from BioSimSpace.Metadynamics import CollectiveVariable as _CollectiveVariable
@@ -40,9 +40,22 @@ from ._protocol import Protocol as _Protocol
 # Store the collective variable base type.
 _colvar_type = _CollectiveVariable._collective_variable.CollectiveVariable
 
+# The allowed verse options.
+_verse_options = frozenset(("both", "larger", "smaller"))
+
+# Translation table for removing whitespace from strings.
+_whitespace_table = str.maketrans("", "", " \t\n")
+
 class Steering(_Protocol):
     """A class for storing steered molecular dynamics protocols."""
 
+    # Store member data in slots rather than a per-instance dictionary.
+    __slots__ = ("_collective_variable", "_n_cvs", "_schedule", "_n_stages",
+                 "_schedule_ps", "_restraints", "_verse", "_timestep",
+                 "_timestep_ps", "_runtime", "_runtime_ps", "_temperature",
+                 "_pressure", "_report_interval", "_restart_interval",
+                 "_colvar_file")
+
     def __init__(self,
                  collective_variable,
                  schedule,
@@ -103,72 +116,67 @@ class Steering(_Protocol):
         # Call the base class constructor.
         super().__init__()
 
-        # Whether this is a newly created object.
-        self._is_new_object = True
-
-        # Set the collective variable.
-        self.setCollectiveVariable(collective_variable)
+        # Set the member data, only checking that it is consistent once
+        # everything has been set.
+        with self.batch_update():
+            # Set the collective variable.
+            self.setCollectiveVariable(collective_variable)
 
-        # Set the time step.
-        self.setTimeStep(timestep)
+            # Set the time step.
+            self.setTimeStep(timestep)
 
-        # Set the runtime.
-        self.setRunTime(runtime)
+            # Set the runtime.
+            self.setRunTime(runtime)
 
-        # Set the verse.
-        self.setVerse(verse)
+            # Set the verse.
+            self.setVerse(verse)
 
-        # Set the schedule.
-        self.setSchedule(schedule)
+            # Set the schedule.
+            self.setSchedule(schedule)
 
-        # Set the restraints.
-        self.setRestraints(restraints)
+            # Set the restraints.
+            self.setRestraints(restraints)
 
-        # Set the system temperature.
-        self.setTemperature(temperature)
+            # Set the system temperature.
+            self.setTemperature(temperature)
 
-        # Set the report interval.
-        self.setReportInterval(report_interval)
+            # Set the report interval.
+            self.setReportInterval(report_interval)
 
-        # Set the restart interval.
-        self.setRestartInterval(restart_interval)
+            # Set the restart interval.
+            self.setRestartInterval(restart_interval)
 
-        # Set the system pressure.
-        if pressure is not None:
-            self.setPressure(pressure)
-        else:
-            self._pressure = None
-
-        if colvar_file is not None:
-            self.setColvarFile(colvar_file)
-        else:
-            self._colvar_file = None
+            # Set the system pressure.
+            if pressure is not None:
+                self.setPressure(pressure)
+            else:
+                self._pressure = None
 
-        # Flag that the object has been created.
-        self._is_new_object = False
+            if colvar_file is not None:
+                self.setColvarFile(colvar_file)
+            else:
+                self._colvar_file = None
 
     def __str__(self):
         """Return a human readable string representation of the object."""
         if self._is_customised:
             return "<BioSimSpace.Protocol.Custom>"
         else:
-            string = "<BioSimSpace.Protocol.Steering: "
-            string += "collective_variable=%s" % self._collective_variable
-            string += ", schedule=%s" % self._schedule
-            string += ", restraints=%s" % self._restraints
-            string += ", verse=%s" % self._verse
-            string += ", timestep=%s" % self._timestep
-            string += ", runtime=%s" % self._runtime
-            string += ", temperature=%s" % self._temperature
+            parts = [f"collective_variable={self._collective_variable}",
+                     f"schedule={self._schedule}",
+                     f"restraints={self._restraints}",
+                     f"verse={self._verse}",
+                     f"timestep={self._timestep}",
+                     f"runtime={self._runtime}",
+                     f"temperature={self._temperature}"]
             if self._pressure is not None:
-                string += ", pressure=%s" % self._pressure
+                parts.append(f"pressure={self._pressure}")
             if self._colvar_file is not None:
-                string += ", colvar_file=%r" % self._colvar_file
-            string += ", report_interval=%d" % self._report_interval
-            string += ", restart_interval=%d" % self._restart_interval
-            string += ">"
+                parts.append(f"colvar_file={self._colvar_file!r}")
+            parts.append(f"report_interval={self._report_interval:d}")
+            parts.append(f"restart_interval={self._restart_interval:d}")
 
-            return string
+            return "<BioSimSpace.Protocol.Steering: " + ", ".join(parts) + ">"
 
     def __repr__(self):
         """Return a string showing how to instantiate the object."""
@@ -196,30 +204,16 @@ class Steering(_Protocol):
                The collective variable (or variables) for the simulation.
         """
 
-        # A single collective variable.
-        if isinstance(collective_variable, _colvar_type):
-            self._collective_variable = [collective_variable]
-
-        else:
-            # Convert tuple to list.
-            if type(collective_variable) is tuple:
-                collective_variable = tuple(collective_variable)
-
-            if type(collective_variable) is list:
-                if not all(isinstance(x, _colvar_type) for x in collective_variable):
-                    raise TypeError("'collective_variable' must all be of type "
-                                    "'BioSimSpace.Metadynamics.CollectiveVariable'")
-            else:
-                raise TypeError("'collective_variable' must be of type "
-                                "'BioSimSpace.Metadynamics.CollectiveVariable' "
-                                "or a list of 'BioSimSpace.Metadynamics.CollectiveVariable' types.")
+        collective_variable = _normalize_list(collective_variable, _colvar_type,
+            "collective_variable", "BioSimSpace.Metadynamics.CollectiveVariable")
 
+        # Store the collective variables and check that other member data is
+        # consistent.
+        with self.batch_update():
             self._collective_variable = collective_variable
 
-        # If the object has already been created, then check that other member
-        # data is consistent.
-        if not self._is_new_object:
-            self.setRestraints(self._restraints)
+            # Store the number of collective variables.
+            self._n_cvs = len(collective_variable)
 
     def getSchedule(self):
         """Return steering schedule.
@@ -231,10 +225,11 @@ class Steering(_Protocol):
                The schedule for the steering, i.e. the integration time steps
                at which restraints are applied/adjusted.
         """
-        steps = []
-        for time in self._schedule:
-            steps.append(_math.floor(time / self._timestep))
-        return steps
+        import numpy as _np
+
+        # Divide the schedule times by the time step in a single NumPy
+        # operation. (Both are stored in picoseconds, the default time unit.)
+        return _np.floor(self._schedule_ps / self._timestep_ps).astype(_np.int64).tolist()
 
     def setSchedule(self, schedule):
         """Set the steering schedule.
@@ -246,36 +241,23 @@ class Steering(_Protocol):
                The time schedule for the steering.
         """
 
-        # Convert tuple to list.
-        if type(schedule) is tuple:
-            schedule = list(schedule)
+        schedule = _normalize_list(schedule, _Types.Time, "schedule", "BioSimSpace.Types.Time")
 
-        if type(schedule) is list:
-            if not all(isinstance(x, _Types.Time) for x in schedule):
-                raise TypeError("'schedule' must all be of type "
-                                "'BioSimSpace.Types.Time'")
-        else:
-            raise TypeError("'schedule' must be a list of "
-                            "'BioSimSpace.Types.Time' types.")
+        if len(schedule) == 0:
+            raise ValueError("'schedule' must contain at least one time!")
 
-        # Make sure the times are linearly increasing and are less than
-        # the total run time.
-        last_time = schedule[0]
-        for x in range(1, len(schedule)):
-            if last_time > self._runtime:
-                raise ValueError("'schedule' values cannot exceed the 'runtime'!")
-            if schedule[x] > self._runtime:
-                raise ValueError("'schedule' values cannot exceed the 'runtime'!")
-            if schedule[x] < last_time:
-                raise ValueError("The steering 'schedule' must increase in time!")
-            last_time = schedule[x]
-
-        self._schedule = schedule
-
-        # If the object has already been created, then check that other member
-        # data is consistent.
-        if not self._is_new_object:
-            self.setRestraints(self._restraints)
+        import numpy as _np
+
+        # Store the schedule and check that other member data is consistent.
+        with self.batch_update():
+            self._schedule = schedule
+
+            # Store the number of stages in the schedule.
+            self._n_stages = len(schedule)
+
+            # Store the schedule times in picoseconds for fast conversion to steps.
+            self._schedule_ps = _np.fromiter((x.picoseconds().magnitude() for x in schedule),
+                                             dtype=_np.float64, count=len(schedule))
 
     def getRestraints(self):
         """Return the restraint on each collective variable for each stage in
@@ -312,42 +294,31 @@ class Steering(_Protocol):
             raise TypeError("'restraints' must be a list of "
                             "'BioSimSpace.CollectiveVariable.Restraint' types.")
 
-        # Make sure we are self-consistent with the schedule.
-        if len(restraints) != len(self._schedule):
-            raise ValueError(f"'len(restraints) != len(schedule), i.e. {len(restraints)} != {len(self._schedule)}")
-
         # Convert all single entries to lists and validate types.
         new_restraints = []
-        num_cvs = len(self._collective_variable)
         for restraint in restraints:
             # Convert tuple to list.
-            if type(restraint) is tuple:
+            if isinstance(restraint, tuple):
                 restraint = list(restraint)
             # Convert any non-list type to a list.
-            if type(restraint) is not list:
+            elif not isinstance(restraint, list):
                 restraint = [restraint]
-            # Validate that there is a restraint for each collective variable
-            # for each stage in the schedule.
-            if len(restraint) != num_cvs:
-                raise ValueError("Must have a restraint for each collective "
-                                 "variable for each stage of the schedule.")
-            # Validate type.
-            if not all(isinstance(x, _Restraint) for x in restraint):
-                raise TypeError("'restraint' must all be of type "
-                                "'BioSimSpace.Metadynamics.Restraint'")
-            # Validate that restraints are harmonic.
-            if not all(r.getSlope() == 0 for r in restraint):
-                raise ValueError("'restraints' can only contain harmonic restraints!")
-            # Validate that the value of the restraint matches the type of each
-            # collective variable for each stage in the schedule.
-            if not all(type(r.getValue()) in self._collective_variable[x]._types for x, r in enumerate(restraint)):
-                raise ValueError("The type of value for each restraint must match the "
-                                 "type of the collective variable to which it corresponds.")
+            for r in restraint:
+                # Validate type.
+                if not isinstance(r, _Restraint):
+                    raise TypeError("'restraint' must be of type "
+                                    "'BioSimSpace.Metadynamics.Restraint' or a list of "
+                                    "'BioSimSpace.Metadynamics.Restraint' types.")
+                # Validate that restraints are harmonic.
+                if r.getSlope() != 0:
+                    raise ValueError("'restraints' can only contain harmonic restraints!")
 
             # Append to the new list.
             new_restraints.append(restraint)
 
-        self._restraints = new_restraints
+        # Store the restraints and check that other member data is consistent.
+        with self.batch_update():
+            self._restraints = new_restraints
 
     def getVerse(self):
         """Returns whether the restraint is acting for values of the collective
@@ -378,27 +349,14 @@ class Steering(_Protocol):
                on "both" sides (default).
         """
 
-        # Convert tuple to list.
-        if type(verse) is tuple:
-            verse = list(verse)
-        elif type(verse) is str:
-            verse = [verse]
-
-        if type(verse) is list:
-            if not all(isinstance(x, str) for x in verse):
-                raise TypeError("'verse' must be of type 'str' or a list of 'str' types.")
+        verse = _normalize_list(verse, str, "verse", "str")
 
-        new_verse = []
-        allowed = ["both", "larger", "smaller"]
+        # Strip whitespace and convert to lower case.
+        new_verse = [v.translate(_whitespace_table).lower() for v in verse]
 
-        for v in verse:
-            # Convert to lower case and strip whitespace.
-            v = v.lower().replace(" ", "")
-
-            if v not in allowed:
-                raise ValueError(f"'verse' must be one of: {allowed}")
-            else:
-                new_verse.append(v)
+        for v in new_verse:
+            if v not in _verse_options:
+                raise ValueError(f"'verse' must be one of: {sorted(_verse_options)}")
 
         self._verse = new_verse
 
@@ -422,15 +380,13 @@ class Steering(_Protocol):
            timestep : :class:`Time <BioSimSpace.Types.Time>`
                The integration time step.
         """
-        if type(timestep) is _Types.Time:
-            self._timestep = timestep
-        else:
+        if type(timestep) is not _Types.Time:
             raise TypeError("'timestep' must be of type 'BioSimSpace.Types.Time'")
 
-        # If the object has already been created, then check that other member
-        # data is consistent.
-        if not self._is_new_object:
-            self.setSchedule(self._schedule)
+        # Store the time step and check that other member data is consistent.
+        with self.batch_update():
+            self._timestep = timestep
+            self._timestep_ps = timestep.picoseconds().magnitude()
 
     def getRunTime(self):
         """Return the running time.
@@ -452,15 +408,13 @@ class Steering(_Protocol):
            runtime : :class:`Time <BioSimSpace.Types.Time>`
                The simulation run time.
         """
-        if type(runtime) is _Types.Time:
-            self._runtime = runtime
-        else:
+        if type(runtime) is not _Types.Time:
             raise TypeError("'runtime' must be of type 'BioSimSpace.Types.Time'")
 
-        # If the object has already been created, then check that other member
-        # data is consistent.
-        if not self._is_new_object:
-            self.setSchedule(self._schedule)
+        # Store the runtime and check that other member data is consistent.
+        with self.batch_update():
+            self._runtime = runtime
+            self._runtime_ps = runtime.picoseconds().magnitude()
 
     def getTemperature(self):
         """Return temperature.
@@ -601,3 +555,76 @@ class Steering(_Protocol):
             raise ValueError("'colvar_file' doesn't exist: %s" % colvar_file)
 
         self._colvar_file = colvar_file
+
+    def _revalidate(self):
+        """Internal function to check that the schedule and restraints are
+           consistent with the other member data.
+        """
+
+        import numpy as _np
+
+        # Make sure the times are linearly increasing and are less than
+        # the total run time. (Compare the stored picosecond values.)
+        if (self._schedule_ps > self._runtime_ps).any():
+            raise ValueError("'schedule' values cannot exceed the 'runtime'!")
+        if (_np.diff(self._schedule_ps) < 0).any():
+            raise ValueError("The steering 'schedule' must increase in time!")
+
+        # Make sure the restraints are self-consistent with the schedule.
+        restraints = self._restraints
+        if len(restraints) != self._n_stages:
+            raise ValueError(f"'len(restraints) != len(schedule), i.e. {len(restraints)} != {self._n_stages}")
+
+        num_cvs = self._n_cvs
+        cv_types = [cv._types for cv in self._collective_variable]
+        for restraint in restraints:
+            # Validate that there is a restraint for each collective variable
+            # for each stage in the schedule.
+            if len(restraint) != num_cvs:
+                raise ValueError("Must have a restraint for each collective "
+                                 "variable for each stage of the schedule.")
+            # Validate that the value of the restraint matches the type of each
+            # collective variable for each stage in the schedule.
+            for r, types in zip(restraint, cv_types):
+                if type(r.getValue()) not in types:
+                    raise ValueError("The type of value for each restraint must match the "
+                                     "type of the collective variable to which it corresponds.")
+
+def _normalize_list(obj, cls, name, type_name):
+    """Internal helper function to convert an object, or a list or tuple of
+       objects, to a list, validating that each entry is of the correct type.
+
+       Parameters
+       ----------
+
+       obj : object, [object], (object)
+           The object (or objects) to normalize.
+
+       cls : type
+           The required type of each entry.
+
+       name : str
+           The name of the argument, used in error messages.
+
+       type_name : str
+           The name of the required type, used in error messages.
+
+       Returns
+       -------
+
+       obj : [object]
+           The validated list of objects.
+    """
+    # Convert tuple to list.
+    if isinstance(obj, tuple):
+        obj = list(obj)
+    # Convert any non-list type to a list.
+    elif not isinstance(obj, list):
+        obj = [obj]
+
+    for x in obj:
+        if not isinstance(x, cls):
+            raise TypeError(f"'{name}' must be of type '{type_name}' "
+                            f"or a list of '{type_name}' types.")
+
+    return obj
@@ -0,0 +1,40 @@
+import BioSimSpace as BSS
+
+import pytest
+
+def test_restraint_indices():
+    """Test that lists of atom indices are sorted and de-duplicated."""
+
+    protocol = BSS.Protocol.Equilibration(restraint=[3, 1, 2, 1])
+
+    assert protocol.getRestraint() == [1, 2, 3]
+
+@pytest.mark.parametrize("restraint", [[1.5, 2],
+                                       ["1", 2],
+                                       [[1, 2], [3, 4]],
+                                       [[1, 2], [3]],
+                                       [1, [2]]])
+def test_invalid_restraint_indices(restraint):
+    """Test that invalid lists of atom indices are rejected."""
+
+    protocol = BSS.Protocol.Equilibration()
+
+    with pytest.raises(ValueError, match="must be a list of 'int' types"):
+        protocol.setRestraint(restraint)
+
+def test_invalid_restraint_keyword():
+    """Test that an unsupported restraint keyword raises a ValueError."""
+
+    with pytest.raises(ValueError, match="must be one of"):
+        BSS.Protocol.Equilibration(restraint="bogus")
+
+@pytest.mark.parametrize("restraint, expected", [(" Heavy ", "heavy"),
+                                                 ("BACK bone", "backbone"),
+                                                 ("All\t", "all"),
+                                                 ("None", None)])
+def test_restraint_keyword(restraint, expected):
+    """Test that restraint keywords are normalised."""
+
+    protocol = BSS.Protocol.Equilibration(restraint=restraint)
+
+    assert protocol.getRestraint() == expected
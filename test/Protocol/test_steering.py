@@ -0,0 +1,148 @@
+import BioSimSpace as BSS
+
+import pytest
+
+@pytest.fixture
+def steering_args():
+    """Return the arguments needed to create a simple steering protocol."""
+
+    # Create two distance collective variables.
+    cv0 = BSS.Metadynamics.CollectiveVariable.Distance(0, 1)
+    cv1 = BSS.Metadynamics.CollectiveVariable.Distance(2, 3)
+
+    # A two stage schedule.
+    schedule = [0*BSS.Units.Time.nanosecond, 0.5*BSS.Units.Time.nanosecond]
+
+    # A restraint on each collective variable for each stage of the schedule.
+    restraints = [[BSS.Metadynamics.Restraint(1*BSS.Units.Length.nanometer),
+                   BSS.Metadynamics.Restraint(1*BSS.Units.Length.nanometer)],
+                  [BSS.Metadynamics.Restraint(2*BSS.Units.Length.nanometer),
+                   BSS.Metadynamics.Restraint(2*BSS.Units.Length.nanometer)]]
+
+    return (cv0, cv1), schedule, restraints
+
+def test_collective_variable_tuple(steering_args):
+    """Test that collective variables can be passed as a tuple."""
+
+    collective_variable, schedule, restraints = steering_args
+
+    protocol = BSS.Protocol.Steering(collective_variable=collective_variable,
+                                     schedule=schedule,
+                                     restraints=restraints)
+
+    assert protocol.getCollectiveVariable() == list(collective_variable)
+
+@pytest.mark.parametrize("interval, getter, default",
+                         [("report_interval", "getReportInterval", 100),
+                          ("restart_interval", "getRestartInterval", 500)])
+def test_non_positive_interval(steering_args, interval, getter, default):
+    """Test that non-positive intervals warn and fall back to the default."""
+
+    collective_variable, schedule, restraints = steering_args
+
+    with pytest.warns(UserWarning):
+        protocol = BSS.Protocol.Steering(collective_variable=collective_variable,
+                                         schedule=schedule,
+                                         restraints=restraints,
+                                         **{interval: -1})
+
+    assert getattr(protocol, getter)() == default
+
+def test_batch_update(steering_args):
+    """Test that consistency checks are deferred within a batch update."""
+
+    collective_variable, schedule, restraints = steering_args
+
+    protocol = BSS.Protocol.Steering(collective_variable=collective_variable,
+                                     schedule=schedule,
+                                     restraints=restraints,
+                                     runtime=1*BSS.Units.Time.nanosecond)
+
+    # Extending the schedule beyond the current runtime is only consistent
+    # once the runtime has also been extended.
+    new_schedule = [0*BSS.Units.Time.nanosecond, 1.5*BSS.Units.Time.nanosecond]
+    with protocol.batch_update():
+        protocol.setSchedule(new_schedule)
+        protocol.setRunTime(2*BSS.Units.Time.nanosecond)
+
+    assert protocol.getSchedule() == [0, 750000]
+    assert protocol.getRunTime() == 2*BSS.Units.Time.nanosecond
+
+def test_setter_rollback(steering_args):
+    """Test that a setter that fails the consistency checks leaves the
+       protocol unchanged.
+    """
+
+    collective_variable, schedule, restraints = steering_args
+
+    protocol = BSS.Protocol.Steering(collective_variable=collective_variable,
+                                     schedule=schedule,
+                                     restraints=restraints)
+
+    old_schedule = protocol.getSchedule()
+    old_restraints = protocol.getRestraints()
+
+    # The restraints don't match the number of stages in the schedule.
+    with pytest.raises(ValueError):
+        protocol.setRestraints(restraints + restraints)
+
+    # The schedule exceeds the runtime.
+    with pytest.raises(ValueError):
+        protocol.setSchedule([0*BSS.Units.Time.nanosecond, 2*BSS.Units.Time.nanosecond])
+
+    assert protocol.getSchedule() == old_schedule
+    assert protocol.getRestraints() == old_restraints
+
+    # The protocol should still be usable.
+    protocol.setRunTime(0.8*BSS.Units.Time.nanosecond)
+    assert protocol.getRunTime() == 0.8*BSS.Units.Time.nanosecond
+
+def test_batch_update_rollback(steering_args):
+    """Test that a batch update that leaves the protocol inconsistent is
+       rolled back.
+    """
+
+    collective_variable, schedule, restraints = steering_args
+
+    protocol = BSS.Protocol.Steering(collective_variable=collective_variable,
+                                     schedule=schedule,
+                                     restraints=restraints,
+                                     runtime=1*BSS.Units.Time.nanosecond)
+
+    old_schedule = protocol.getSchedule()
+
+    # A three stage schedule is inconsistent with the two stage restraints.
+    with pytest.raises(ValueError):
+        with protocol.batch_update():
+            protocol.setRunTime(3*BSS.Units.Time.nanosecond)
+            protocol.setSchedule([0*BSS.Units.Time.nanosecond,
+                                  1*BSS.Units.Time.nanosecond,
+                                  2.5*BSS.Units.Time.nanosecond])
+
+    assert protocol.getRunTime() == 1*BSS.Units.Time.nanosecond
+    assert protocol.getSchedule() == old_schedule
+
+def test_empty_schedule(steering_args):
+    """Test that an empty schedule is rejected."""
+
+    collective_variable, schedule, restraints = steering_args
+
+    with pytest.raises(ValueError, match="at least one time"):
+        BSS.Protocol.Steering(collective_variable=collective_variable,
+                              schedule=[],
+                              restraints=[])
+
+def test_verse(steering_args):
+    """Test that verse options are normalised and validated."""
+
+    collective_variable, schedule, restraints = steering_args
+
+    protocol = BSS.Protocol.Steering(collective_variable=collective_variable,
+                                     schedule=schedule,
+                                     restraints=restraints,
+                                     verse=[" Larger", "SMALLER\t"])
+
+    assert protocol.getVerse() == ["larger", "smaller"]
+
+    with pytest.raises(ValueError, match=r"must be one of: \['both', 'larger', 'smaller'\]"):
+        protocol.setVerse("sideways")